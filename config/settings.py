@@ -1,7 +1,8 @@
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from typing import NamedTuple
 
-load_dotenv()
+from dotenv import load_dotenv
 
 APP_NAME = "AI Journaling Companion"
 APP_VERSION = "1.0.0"
@@ -27,8 +28,49 @@ CORS_ORIGINS = ["*"]
 # OpenAI Configuration (Optional)
 # If enabled, enhances reflection wording for emotional resonance and engagement
 # Local NLP (sentiment + themes) remains the authoritative source of truth
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-USE_OPENAI_REFINEMENT = os.getenv("USE_OPENAI_REFINEMENT", "false").lower() == "true"
+# The API key and enable flag come from the environment (or .env) and are read
+# lazily via get_openai_settings(), so importing this module never touches disk
 OPENAI_MODEL = "gpt-4o-mini"
 OPENAI_MAX_TOKENS = 300  # Increased to support 3-6 sentence reflections
 OPENAI_TEMPERATURE = 0.8  # Slightly higher for more natural, warm responses
+# Retries for transient failures (rate limits, 5xx, timeouts, connection errors)
+# Handled by the OpenAI client with exponential backoff + jitter, honoring
+# Retry-After; 2 retries = up to 3 attempts before falling back to the base reflection
+OPENAI_MAX_RETRIES = 2
+# Skip the API call for short, clearly positive, single-theme reflections
+# The template reflection already fits these entries well, so refining them
+# spends latency and tokens for little gain; set False to refine everything
+SKIP_REFINEMENT_FOR_TRIVIAL = True
+
+
+class OpenAISettings(NamedTuple):
+    """Environment-driven OpenAI settings (see get_openai_settings)."""
+    api_key: str
+    use_refinement: bool
+
+
+@lru_cache(maxsize=1)
+def _load_env() -> None:
+    """
+    Load variables from a local .env file, once per process.
+    
+    Deferred until OpenAI settings are first needed so that importing the
+    app (and processes where the environment is injected directly) skips
+    the .env lookup entirely.
+    """
+    load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_openai_settings() -> OpenAISettings:
+    """
+    Get the OpenAI refinement settings, loading .env on first call.
+    
+    Returns:
+        OpenAISettings: API key (empty if unset) and whether refinement is enabled
+    """
+    _load_env()
+    return OpenAISettings(
+        api_key=os.getenv("OPENAI_API_KEY", ""),
+        use_refinement=os.getenv("USE_OPENAI_REFINEMENT", "false").lower() == "true"
+    )
@@ -1,20 +1,46 @@
+import json
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import ValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, ValidationError
 
 from config.settings import APP_NAME, APP_VERSION, APP_DESCRIPTION, CORS_ORIGINS
-from models.schemas import JournalEntryInput, JournalEntryResponse
+from models.schemas import (
+    JournalEntryInput,
+    JournalEntryResponse,
+    SentimentAnalysis,
+    ThemeDetection,
+    EmpathyReflection,
+    _now_utc
+)
 from storage.memory_store import get_store
-from services.nlp_service import analyze_entry
+from services.nlp_service import analyze_entry, warmup
 from services.reflection_service import generate_reflection
 from services.openai_refinement_service import refine_reflection_with_llm
 from services.insights_service import generate_insights
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application startup/shutdown hook.
+    
+    Warms the NLP resources before the server accepts traffic, so the
+    one-time TextBlob import and lexicon load are paid at startup instead of
+    on the first user's POST /entries.
+    """
+    warmup()
+    
+    yield
+
+
 app = FastAPI(
     title=APP_NAME,
     version=APP_VERSION,
-    description=APP_DESCRIPTION
+    description=APP_DESCRIPTION,
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -26,6 +52,72 @@ app.add_middleware(
 )
 
 
+class ModelJSONResponse(Response):
+    """
+    JSON response rendered directly by a Pydantic model's core serializer.
+    
+    Returning a Response from a route makes FastAPI skip its own response_model
+    validation and jsonable_encoder pass; the model is encoded once in
+    pydantic-core instead. response_model is still declared on each route so
+    the OpenAPI schema and Swagger UI are unchanged.
+    
+    Because nothing re-checks the model here, callers must only pass models
+    whose every field is already known to be valid: validated request input,
+    service output, or defaults filled in by the route (e.g. the timestamp
+    in create_entry). Never pass a model_construct() result that carries
+    unchecked user input.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: BaseModel) -> bytes:
+        # Use the model's prebuilt serializer directly: it emits bytes, which
+        # avoids the str decode/encode round trip of model_dump_json()
+        return content.__pydantic_serializer__.to_json(content)
+
+
+# /health payload never changes for the life of the process, so it is
+# serialized once here instead of on every probe
+_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "app": APP_NAME,
+    "version": APP_VERSION,
+    "privacy": "All processing is local, no data leaves this system"
+}).encode("utf-8")
+
+# Shared in-memory store, resolved once at import instead of per request
+_STORE = get_store()
+
+
+def _construct_response(entry_data: dict) -> JournalEntryResponse:
+    """
+    Rebuild a JournalEntryResponse from a stored entry without revalidation.
+    
+    Trust boundary: entries in the in-memory store were produced by our own
+    services and validated when they were created in POST /entries. Nothing
+    outside this process can write to the store, so re-running the Pydantic
+    validators on every read is redundant. model_construct() skips field
+    validation and type coercion for the wrapper and each nested model.
+    
+    Do NOT use this helper for data that originates outside the store.
+    
+    Args:
+        entry_data: Entry dictionary as returned by InMemoryStore.get_entry()
+    
+    Returns:
+        JournalEntryResponse: Response model built without validation
+    """
+    return JournalEntryResponse.model_construct(
+        entry_id=entry_data["entry_id"],
+        timestamp=entry_data["timestamp"],
+        content=entry_data["content"],
+        sentiment=SentimentAnalysis.model_construct(**entry_data["sentiment"]),
+        themes=ThemeDetection.model_construct(**entry_data["themes"]),
+        reflection=EmpathyReflection.model_construct(**entry_data["reflection"]),
+        engagement_note=entry_data.get("engagement_note"),
+        reflection_summary=entry_data.get("reflection_summary")
+    )
+
+
 @app.get("/health")
 async def health_check():
     """
@@ -34,19 +126,16 @@ async def health_check():
     Returns basic application status and confirms the service is running.
     No authentication required, no sensitive data exposed.
     
+    The body is constant, so it is serialized once at startup.
+    
     Returns:
-        dict: Status message and application info
+        Response: JSON status message and application info
     
     Example:
         GET /health
         Response: {"status": "healthy", "app": "AI Journaling Companion", "version": "1.0.0"}
     """
-    return {
-        "status": "healthy",
-        "app": APP_NAME,
-        "version": APP_VERSION,
-        "privacy": "All processing is local, no data leaves this system"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.post("/entries", response_model=JournalEntryResponse, status_code=status.HTTP_201_CREATED)
@@ -116,13 +205,13 @@ async def create_entry(entry_input: JournalEntryInput):
         base_reflection = generate_reflection(sentiment, themes, mode)
         
         # Step 3: Optionally refine reflection wording with OpenAI
-        # Falls back to base_reflection if disabled or fails
-        reflection = refine_reflection_with_llm(base_reflection, sentiment, themes)
+        # Falls back to base_reflection if disabled or fails; awaited so other
+        # requests are served while the API call is in flight
+        reflection = await refine_reflection_with_llm(base_reflection, sentiment, themes)
         
         # Step 4: Get entry count and recent entries for insights
-        store = get_store()
-        entry_count = store.get_entry_count()
-        recent_entries = store.get_recent_entries(limit=4)
+        entry_count = _STORE.get_entry_count()
+        recent_entries = _STORE.get_recent_entries(limit=4)
         
         # Step 5: Generate insights (engagement note + reflection summary)
         insights = generate_insights(
@@ -132,9 +221,16 @@ async def create_entry(entry_input: JournalEntryInput):
         )
         
         # Step 6: Create response object with insights
-        response = JournalEntryResponse(
+        # timestamp is Optional on input but required on the response; an
+        # explicit null falls back to the same default as an omitted field
+        timestamp = entry_input.timestamp or _now_utc()
+        
+        # Nested models were just built by our own services and the remaining
+        # fields are validated input or the defaulted timestamp, so the wrapper
+        # is assembled with model_construct to avoid a second validation pass
+        response = JournalEntryResponse.model_construct(
             entry_id="",  # Will be set by storage
-            timestamp=entry_input.timestamp,
+            timestamp=timestamp,
             content=entry_input.content,
             sentiment=sentiment,
             themes=themes,
@@ -144,14 +240,25 @@ async def create_entry(entry_input: JournalEntryInput):
         )
         
         # Step 7: Store in memory with mode for pattern aggregation
-        entry_dict = response.dict()
-        entry_dict["mode"] = mode  # Add mode for future pattern detection
-        entry_id = store.store_entry(entry_dict)
+        # Fields are known, so build the stored dict directly instead of
+        # dumping the whole response model
+        entry_dict = {
+            "entry_id": "",
+            "timestamp": timestamp,
+            "content": entry_input.content,
+            "sentiment": sentiment.model_dump(),
+            "themes": themes.model_dump(),
+            "reflection": reflection.model_dump(),
+            "engagement_note": response.engagement_note,
+            "reflection_summary": response.reflection_summary,
+            "mode": mode  # Add mode for future pattern detection
+        }
+        entry_id = _STORE.store_entry(entry_dict)
         
         # Step 8: Update response with generated entry_id
         response.entry_id = entry_id
         
-        return response
+        return ModelJSONResponse(response, status_code=status.HTTP_201_CREATED)
         
     except ValidationError as e:
         # Pydantic validation errors (should be caught by FastAPI, but defensive)
@@ -193,8 +300,7 @@ async def get_entry(entry_id: str):
         Response: {complete entry data}
     """
     try:
-        store = get_store()
-        entry_data = store.get_entry(entry_id)
+        entry_data = _STORE.get_entry(entry_id)
         
         if entry_data is None:
             raise HTTPException(
@@ -202,8 +308,8 @@ async def get_entry(entry_id: str):
                 detail=f"Entry with ID '{entry_id}' not found"
             )
         
-        # Convert stored dict back to Pydantic model for validation
-        return JournalEntryResponse(**entry_data)
+        # Stored data is trusted (validated at insert time), so skip revalidation
+        return ModelJSONResponse(_construct_response(entry_data))
         
     except HTTPException:
         # Re-raise HTTP exceptions as-is
@@ -233,8 +339,16 @@ async def validation_exception_handler(request, exc):
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
     
+    # Auto-reload watches the filesystem and is only useful while developing
+    dev_mode = os.getenv("DEV") == "1"
+    
+    # Each worker process has its own in-memory store, so entries created in
+    # one worker are invisible to the others; keep the default at 1
+    workers = int(os.getenv("WORKERS", "1"))
+    
     print(f"Starting {APP_NAME} v{APP_VERSION}")
     print("Privacy-first journaling with local AI analysis")
     print("No external API calls • No data persistence • No user tracking")
@@ -245,5 +359,6 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=dev_mode,
+        workers=None if dev_mode else workers
     )
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import List, Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 MAX_ENTRY_LENGTH = 5000
@@ -9,6 +9,16 @@ MAX_REFLECTION_LENGTH = 1000
 MAX_PROMPT_LENGTH = 200
 
 
+def _now_utc() -> datetime:
+    """
+    Return the current time as a timezone-aware UTC datetime.
+    
+    Used as the default timestamp factory. Replaces the deprecated
+    datetime.utcnow(), which also returned a naive datetime.
+    """
+    return datetime.now(timezone.utc)
+
+
 class JournalEntryInput(BaseModel):
     """
     Input model for journal entries submitted by users.
@@ -30,7 +40,7 @@ class JournalEntryInput(BaseModel):
         description="Journal entry content between 1 and 5000 characters"
     )
     timestamp: Optional[datetime] = Field(
-        default_factory=lambda: datetime.utcnow(),
+        default_factory=_now_utc,
         description="Entry timestamp, defaults to current UTC time"
     )
     
@@ -77,6 +87,9 @@ class SentimentAnalysis(BaseModel):
             label="positive"
         )
     """
+    # Frozen: analyze_entry returns the same cached instance to every caller
+    model_config = ConfigDict(frozen=True)
+    
     polarity: float = Field(
         ...,
         ge=-1.0,
@@ -102,6 +115,10 @@ class ThemeDetection(BaseModel):
     Transparent, explainable theme detection. Users can understand
     why a theme was detected based on keywords present.
     
+    Output-only model: themes are produced by the NLP service, which
+    already emits unique, lowercase names in alphabetical order, so no
+    normalization runs at construction time.
+    
     Attributes:
         themes: List of detected theme names (lowercase)
         confidence: Confidence level in theme detection
@@ -112,6 +129,9 @@ class ThemeDetection(BaseModel):
             confidence="medium"
         )
     """
+    # Frozen for the same reason as SentimentAnalysis
+    model_config = ConfigDict(frozen=True)
+    
     themes: List[str] = Field(
         default_factory=list,
         description="List of detected themes (can be empty)"
@@ -120,23 +140,6 @@ class ThemeDetection(BaseModel):
         ...,
         description="Confidence level in theme detection"
     )
-    
-    @field_validator('themes')
-    @classmethod
-    def normalize_themes(cls, v: List[str]) -> List[str]:
-        """
-        Normalize themes to lowercase and remove duplicates.
-        
-        Ensures consistent theme representation and prevents
-        duplicate themes from appearing in results.
-        
-        Args:
-            v: List of theme strings
-            
-        Returns:
-            Normalized list of unique, lowercase themes
-        """
-        return list(dict.fromkeys(theme.lower() for theme in v))
 
 
 class EmpathyReflection(BaseModel):
@@ -146,6 +149,9 @@ class EmpathyReflection(BaseModel):
     Responsible AI design: Non-judgmental, validating, non-prescriptive.
     No advice-giving, no diagnosis, no predictions about future behavior.
     
+    Output-only model: producers (templates and the LLM response parser)
+    supply already-stripped text, so no whitespace validator runs here.
+    
     Attributes:
         message: Main empathetic reflection text
         prompt: Optional gentle follow-up prompt for further reflection
@@ -168,21 +174,8 @@ class EmpathyReflection(BaseModel):
         description="Optional follow-up prompt (max 200 characters)"
     )
     
-    @field_validator('message', 'prompt')
-    @classmethod
-    def strip_whitespace(cls, v: Optional[str]) -> Optional[str]:
-        """
-        Strip leading and trailing whitespace from reflection text.
-        
-        Ensures clean, professional presentation of reflections.
-        
-        Args:
-            v: String to strip (or None for optional fields)
-            
-        Returns:
-            Stripped string or None
-        """
-        return v.strip() if v else v
+    # Frozen: reflection_service hands out shared, cached instances
+    model_config = ConfigDict(frozen=True)
 
 
 class JournalEntryResponse(BaseModel):
@@ -207,7 +200,7 @@ class JournalEntryResponse(BaseModel):
     Example:
         response = JournalEntryResponse(
             entry_id="123e4567-e89b-12d3-a456-426614174000",
-            timestamp=datetime.utcnow(),
+            timestamp=datetime.now(timezone.utc),
             content="Today was a good day.",
             sentiment=SentimentAnalysis(...),
             themes=ThemeDetection(...),
@@ -13,7 +13,39 @@ All features are:
 """
 
 from typing import Dict, List, Optional, Tuple
-from collections import Counter
+
+
+# Engagement notes keyed by total entry count
+# No note for 1 entry (too early) or 5+ entries (avoid repetition)
+ENGAGEMENT_NOTES = {
+    2: "You're showing up. That's what matters.",
+    3: "You've been showing up and reflecting consistently. That matters.",
+    4: "You've been showing up and reflecting consistently. That matters.",
+}
+
+# Reflection summary templates keyed by dominant emotional mode
+# Each entry is (opening, theme sentence, closing); the theme sentence is
+# formatted with {theme} (as written) or {Theme} (capitalized)
+# - low_energy: Normalizing, non-activating
+# - anxious: Grounding, non-problem-solving
+# - calm: Reflective, reinforcing
+SUMMARY_TEMPLATES: Dict[str, Tuple[str, str, str]] = {
+    "low_energy": (
+        "Looking back at your recent entries, a low-energy tone shows up often.",
+        " You've also mentioned {theme} a few times during these moments.",
+        " This isn't something to change — just something worth noticing.",
+    ),
+    "anxious": (
+        "Your recent entries carry a sense of weight and mental activity.",
+        " {Theme} comes up more than once.",
+        " You're holding a lot, and noticing that is enough for now.",
+    ),
+    "calm": (
+        "There's a reflective quality to your recent entries.",
+        " {Theme} seems to be on your mind.",
+        " You're taking time to notice and reflect, and that's valuable.",
+    ),
+}
 
 
 def generate_engagement_note(entry_count: int) -> Optional[str]:
@@ -38,13 +70,7 @@ def generate_engagement_note(entry_count: int) -> Optional[str]:
         note = generate_engagement_note(3)
         # Returns: "You've been showing up and reflecting consistently. That matters."
     """
-    if entry_count == 2:
-        return "You're showing up. That's what matters."
-    elif entry_count in [3, 4]:
-        return "You've been showing up and reflecting consistently. That matters."
-    else:
-        # No note for 1 entry (too early) or 5+ (avoid repetition)
-        return None
+    return ENGAGEMENT_NOTES.get(entry_count)
 
 
 def aggregate_patterns(recent_entries: List[dict]) -> Dict[str, any]:
@@ -90,30 +116,32 @@ def aggregate_patterns(recent_entries: List[dict]) -> Dict[str, any]:
             "entry_count": 0
         }
     
-    # Extract modes and themes from entries
-    modes = []
-    themes = []
+    # Count modes and themes in a single pass with plain dicts
+    # (the window is only 3-4 entries, so Counter/heapq overhead dominates)
+    mode_counts = {}
+    theme_counts = {}
     
     for entry in recent_entries:
         # Get emotional mode (now stored in entry dict)
         if "mode" in entry:
-            modes.append(entry["mode"])
+            mode = entry["mode"]
+            mode_counts[mode] = mode_counts.get(mode, 0) + 1
         
-        # Extract themes from entry
-        if "themes" in entry and "themes" in entry["themes"]:
-            themes.extend(entry["themes"]["themes"])
-    
-    # Count occurrences
-    mode_counter = Counter(modes)
-    theme_counter = Counter(themes)
+        # Extract themes from entry (skipped when none were detected,
+        # which is common for short entries)
+        entry_themes = entry.get("themes")
+        if entry_themes and entry_themes.get("themes"):
+            for theme in entry_themes["themes"]:
+                theme_counts[theme] = theme_counts.get(theme, 0) + 1
     
     # Identify dominant patterns
-    dominant_mode = mode_counter.most_common(1)[0][0] if mode_counter else None
-    top_theme = theme_counter.most_common(1)[0][0] if theme_counter else None
+    # max() keeps the first-seen key on ties, matching Counter.most_common(1)
+    dominant_mode = max(mode_counts, key=mode_counts.get) if mode_counts else None
+    top_theme = max(theme_counts, key=theme_counts.get) if theme_counts else None
     
     return {
-        "mode_counts": dict(mode_counter),
-        "theme_counts": dict(theme_counter),
+        "mode_counts": mode_counts,
+        "theme_counts": theme_counts,
         "dominant_mode": dominant_mode,
         "top_theme": top_theme,
         "entry_count": len(recent_entries)
@@ -154,52 +182,20 @@ def generate_reflection_summary(
     if entry_count < 3:
         return None
     
-    top_theme = patterns.get("top_theme")
-    mode_counts = patterns.get("mode_counts", {})
-    
-    # Build summary based on dominant mode
-    if dominant_mode == "low_energy":
-        # Normalizing, non-activating tone
-        base = "Looking back at your recent entries, a low-energy tone shows up often."
-        
-        if top_theme:
-            theme_context = f" You've also mentioned {top_theme} a few times during these moments."
-        else:
-            theme_context = ""
-        
-        closing = " This isn't something to change — just something worth noticing."
-        
-        return base + theme_context + closing
-    
-    elif dominant_mode == "anxious":
-        # Grounding, non-problem-solving tone
-        base = "Your recent entries carry a sense of weight and mental activity."
-        
-        if top_theme:
-            theme_context = f" {top_theme.capitalize()} comes up more than once."
-        else:
-            theme_context = ""
-        
-        closing = " You're holding a lot, and noticing that is enough for now."
-        
-        return base + theme_context + closing
+    # Unknown modes have no template and produce no summary
+    template = SUMMARY_TEMPLATES.get(dominant_mode)
+    if template is None:
+        return None
     
-    elif dominant_mode == "calm":
-        # Reflective, reinforcing tone
-        base = "There's a reflective quality to your recent entries."
-        
-        if top_theme:
-            theme_context = f" {top_theme.capitalize()} seems to be on your mind."
-        else:
-            theme_context = ""
-        
-        closing = " You're taking time to notice and reflect, and that's valuable."
-        
-        return base + theme_context + closing
+    base, theme_format, closing = template
+    top_theme = patterns.get("top_theme")
     
+    if top_theme:
+        theme_context = theme_format.format(theme=top_theme, Theme=top_theme.capitalize())
     else:
-        # Fallback for unknown mode
-        return None
+        theme_context = ""
+    
+    return base + theme_context + closing
 
 
 def generate_insights(
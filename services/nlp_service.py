@@ -1,9 +1,18 @@
 import re
-from textblob import TextBlob
+from functools import lru_cache
 from typing import List, Tuple
 from models.schemas import SentimentAnalysis, ThemeDetection
 
 
+# Result models are built with model_construct() throughout this module.
+# Every field value is computed here (TextBlob scores and fixed labels/themes),
+# so Pydantic validation would only re-check our own output; user input is
+# validated once at the API boundary (JournalEntryInput).
+
+# TextBlob's pattern sentiment scorer, imported on first use (see _get_pattern_sentiment)
+# Importing textblob pulls in NLTK (~0.3s), which theme/mode detection never needs.
+_pattern_sentiment = None
+
 # Sentiment thresholds chosen to create a neutral zone around zero.
 # Rationale: TextBlob polarity scores near zero are often ambiguous or mixed.
 # A ±0.1 threshold reduces false positives for clearly positive/negative labels.
@@ -11,6 +20,12 @@ from models.schemas import SentimentAnalysis, ThemeDetection
 SENTIMENT_POSITIVE_THRESHOLD = 0.1
 SENTIMENT_NEGATIVE_THRESHOLD = -0.1
 
+# Maximum number of distinct entry texts whose analysis is memoized (analyze_entry)
+# Clients that autosave drafts resubmit identical content, and repeats skip
+# TextBlob scoring. The cache keys are raw entry text, so it is emptied
+# with clear_caches() whenever entry data is cleared.
+ANALYSIS_CACHE_SIZE = 1024
+
 # Emotional burden keywords used for sentiment override
 # Rationale: TextBlob's lexicon can misclassify stress/exhaustion as weakly positive
 # due to words like "managed" or "accomplished" appearing alongside burden language.
@@ -117,8 +132,85 @@ THEME_KEYWORDS = {
     ]
 }
 
+# Theme names in the alphabetical order used for detect_themes output
+_SORTED_THEME_NAMES = tuple(sorted(THEME_KEYWORDS))
+
+# Reverse index: theme keyword -> theme(s) it signals
+# A keyword can belong to more than one theme (e.g., "project" → work, creativity)
+_KEYWORD_THEMES = {}
+for _theme_name, _theme_keywords in THEME_KEYWORDS.items():
+    for _keyword in _theme_keywords:
+        _KEYWORD_THEMES.setdefault(_keyword, []).append(_theme_name)
+del _theme_name, _theme_keywords, _keyword
+
+
+def _compile_keyword_pattern(keywords, whole_word: bool = True) -> re.Pattern:
+    """
+    Compile a keyword list into a single alternation regex.
+    
+    Rationale: one C-level scan of the text per category instead of one
+    Python-level search per keyword. For a yes/no search() the alternation is
+    equivalent to testing each keyword separately, because the engine tries
+    every alternative at every position before moving on.
+    
+    Longest keywords come first so the engine tries e.g. "missing" before
+    "miss" instead of matching the prefix and backtracking at the word boundary.
+    
+    Args:
+        keywords: Lowercase keywords or phrases
+        whole_word: Wrap the alternation in word boundaries (\\b)
+    
+    Returns:
+        re.Pattern: Compiled pattern matching any of the keywords
+    """
+    alternation = '|'.join(
+        re.escape(keyword) for keyword in sorted(set(keywords), key=len, reverse=True)
+    )
+    if whole_word:
+        return re.compile(r'\b(?:' + alternation + r')\b')
+    return re.compile(alternation)
+
+
+# One whole-word alternation over every theme keyword
+# Rationale: lets detect_themes scan the text once instead of running one
+# regex search per keyword (~100 per entry). Matches are non-overlapping, which
+# is equivalent to per-keyword search as long as no theme keyword overlaps
+# another keyword inside a phrase (true for the current lists).
+_THEME_KEYWORD_PATTERN = _compile_keyword_pattern(_KEYWORD_THEMES)
 
-def _detect_emotional_burden(content: str) -> bool:
+# Per-category keyword patterns (one scan per category, see above)
+# Burden and low-energy keywords match whole words only ("stress" must not
+# match "distress"); numbness keywords keep substring semantics.
+_BURDEN_PATTERN = _compile_keyword_pattern(EMOTIONAL_BURDEN_KEYWORDS)
+_LOW_ENERGY_PATTERN = _compile_keyword_pattern(LOW_ENERGY_KEYWORDS)
+_NUMBNESS_PATTERN = _compile_keyword_pattern(NUMBNESS_KEYWORDS, whole_word=False)
+
+# Emotional mode signals keep substring semantics (multi-word phrases)
+_RUMINATION_PATTERN = _compile_keyword_pattern(RUMINATION_KEYWORDS, whole_word=False)
+_EXPLICIT_ANXIETY_PATTERN = _compile_keyword_pattern(EXPLICIT_ANXIETY_KEYWORDS, whole_word=False)
+_PRESSURE_PATTERN = _compile_keyword_pattern(PRESSURE_KEYWORDS, whole_word=False)
+
+
+def _get_pattern_sentiment():
+    """
+    Return TextBlob's pattern sentiment scorer, importing it on first call.
+    
+    Theme and mode detection never touch TextBlob, so the NLTK import waits
+    until a sentiment score is first requested (or warmup() runs).
+    
+    Returns:
+        callable: textblob.en.sentiment, mapping text to (polarity, subjectivity)
+    """
+    global _pattern_sentiment
+    
+    if _pattern_sentiment is None:
+        from textblob.en import sentiment
+        _pattern_sentiment = sentiment
+    
+    return _pattern_sentiment
+
+
+def _detect_emotional_burden(content_lower: str) -> bool:
     """
     Detect presence of emotional burden keywords in content.
     
@@ -130,26 +222,20 @@ def _detect_emotional_burden(content: str) -> bool:
     describing stress/burden as "positive" sentiment.
     
     Args:
-        content: Journal entry text to check (will be lowercased)
+        content_lower: Journal entry text to check, already lowercased
     
     Returns:
         bool: True if emotional burden keywords detected, False otherwise
     
     Example:
-        _detect_emotional_burden("Work was stressful but I managed")
+        _detect_emotional_burden("work was stressful but i managed")
         # Returns: True ("stressful" detected)
     """
-    content_lower = content.lower()
-    
     # Check for any emotional burden keywords using whole-word matching
-    for keyword in EMOTIONAL_BURDEN_KEYWORDS:
-        if _match_keyword_whole_word(keyword, content_lower):
-            return True
-    
-    return False
+    return _BURDEN_PATTERN.search(content_lower) is not None
 
 
-def _detect_numbness(content: str) -> bool:
+def _detect_numbness(content_lower: str) -> bool:
     """
     Detect presence of numbness / emotional absence keywords in content.
     
@@ -161,24 +247,18 @@ def _detect_numbness(content: str) -> bool:
     is detected, preventing false positive classifications.
     
     Args:
-        content: Journal entry text to check (will be lowercased)
+        content_lower: Journal entry text to check, already lowercased
     
     Returns:
         bool: True if numbness keywords detected, False otherwise
     
     Example:
-        _detect_numbness("I don't feel sad or happy, just kind of blank")
+        _detect_numbness("i don't feel sad or happy, just kind of blank")
         # Returns: True ("blank" detected)
     """
-    content_lower = content.lower()
-    
     # Check for any numbness keywords using substring matching
     # (some are multi-word phrases like "just existing")
-    for keyword in NUMBNESS_KEYWORDS:
-        if keyword in content_lower:
-            return True
-    
-    return False
+    return _NUMBNESS_PATTERN.search(content_lower) is not None
 
 
 def analyze_sentiment(content: str) -> SentimentAnalysis:
@@ -226,33 +306,54 @@ def analyze_sentiment(content: str) -> SentimentAnalysis:
         # Returns: SentimentAnalysis(polarity=0.15, subjectivity=0.5, label="neutral")
         # (Override applied: emotional burden detected despite positive polarity)
     """
-    # Defensive: Handle empty or whitespace-only content
-    if not content or not content.strip():
-        return SentimentAnalysis(
-            polarity=0.0,
-            subjectivity=0.0,
-            label="neutral"
-        )
+    content_lower = content.lower()
+    polarity, subjectivity, label = _score_sentiment(
+        content, content_lower, _detect_emotional_burden(content_lower)
+    )
+    return SentimentAnalysis.model_construct(
+        polarity=polarity,
+        subjectivity=subjectivity,
+        label=label
+    )
+
+
+def _score_sentiment(
+    content: str,
+    content_lower: str,
+    has_emotional_burden: bool
+) -> Tuple[float, float, str]:
+    """
+    Sentiment analysis core: final scores and label as plain values.
     
-    blob = TextBlob(content)
-    polarity = blob.sentiment.polarity
-    subjectivity = blob.sentiment.subjectivity
+    analyze_entry() already needs the burden flag for mode detection, so it
+    computes it once and passes it in here instead of scanning the text for
+    burden keywords twice. Returning plain values lets callers apply their own
+    overrides (e.g., LOW_ENERGY) and build SentimentAnalysis exactly once.
+    See analyze_sentiment() for the full behavior.
+    
+    Args:
+        content: Journal entry text to analyze (original case, for TextBlob)
+        content_lower: content.lower(), for keyword overrides
+        has_emotional_burden: Result of _detect_emotional_burden(content_lower)
     
-    # Detect emotional burden for potential override
-    has_emotional_burden = _detect_emotional_burden(content)
+    Returns:
+        Tuple[float, float, str]: (polarity, subjectivity, label)
+    """
+    # Defensive: Handle empty or whitespace-only content
+    if not content or not content.strip():
+        return 0.0, 0.0, "neutral"
     
-    # Detect numbness / emotional absence for sentiment override
-    has_numbness = _detect_numbness(content)
+    # Score with TextBlob's default (pattern) lexicon directly. This is exactly
+    # what TextBlob(content).sentiment computes, minus building a TextBlob and
+    # the namedtuple class PatternAnalyzer.analyze() creates on every call.
+    polarity, subjectivity = _get_pattern_sentiment()(content)
     
     # FIX: Numbness override - force neutral sentiment for emotionally absent states
     # Rationale: TextBlob misclassifies numb/flat states as positive due to negated emotions
     # (e.g., "don't feel sad" → positive polarity, but actually indicates numbness)
-    if has_numbness:
-        return SentimentAnalysis(
-            polarity=0.0,  # Force neutral polarity
-            subjectivity=subjectivity,  # Preserve subjectivity
-            label="neutral"  # Override to neutral
-        )
+    # Subjectivity is preserved.
+    if _detect_numbness(content_lower):
+        return 0.0, subjectivity, "neutral"
     
     # Apply threshold-based classification with emotional burden override
     if polarity > SENTIMENT_POSITIVE_THRESHOLD:
@@ -268,30 +369,7 @@ def analyze_sentiment(content: str) -> SentimentAnalysis:
     else:
         label = "neutral"
     
-    return SentimentAnalysis(
-        polarity=polarity,
-        subjectivity=subjectivity,
-        label=label
-    )
-
-
-def _match_keyword_whole_word(keyword: str, text: str) -> bool:
-    """
-    Check if a keyword appears as a whole word in the text.
-    
-    Uses word boundaries (\b) to avoid substring false positives.
-    For example, "stress" won't match "distress" or "stressful".
-    
-    Args:
-        keyword: The keyword to search for (should be lowercase)
-        text: The text to search in (should be lowercase)
-    
-    Returns:
-        bool: True if keyword found as whole word, False otherwise
-    """
-    # Use word boundaries to match whole words only
-    pattern = r'\b' + re.escape(keyword) + r'\b'
-    return bool(re.search(pattern, text))
+    return polarity, subjectivity, label
 
 
 def detect_themes(content: str) -> ThemeDetection:
@@ -308,6 +386,8 @@ def detect_themes(content: str) -> ThemeDetection:
     Keyword matching:
     - Uses whole-word matching to avoid false positives (e.g., "stress" won't match "distress")
     - Case-insensitive for user convenience
+    - One regex pass over the text for all themes (see _THEME_KEYWORD_PATTERN)
+    - Each keyword counts once per entry, however often it appears
     - Deterministic ordering (alphabetical by theme name) for stable output
     
     Confidence levels (based on max keyword count across all themes):
@@ -334,36 +414,57 @@ def detect_themes(content: str) -> ThemeDetection:
         themes = detect_themes("I'm grateful for my family and friends")
         # Returns: ThemeDetection(themes=["gratitude", "relationships"], confidence="medium")
     """
+    return _detect_themes(content.lower())
+
+
+def _detect_themes(content_lower: str) -> ThemeDetection:
+    """
+    Theme detection core for text that is already lowercased.
+    
+    Lets analyze_entry() lowercase the entry once and share it across every
+    check. See detect_themes() for the full behavior.
+    
+    Args:
+        content_lower: Journal entry text, already lowercased
+    
+    Returns:
+        ThemeDetection: Pydantic model with detected themes and confidence
+    """
     # Defensive: Handle empty or whitespace-only content
-    if not content or not content.strip():
-        return ThemeDetection(
+    if not content_lower or not content_lower.strip():
+        return ThemeDetection.model_construct(
             themes=[],
             confidence="low"
         )
     
-    content_lower = content.lower()
-    
-    theme_keyword_counts = {}
+    # Single scan: collect every distinct theme keyword present as a whole word
+    matched_keywords = set(_THEME_KEYWORD_PATTERN.findall(content_lower))
     
-    # Iterate through themes in deterministic order (sorted by key)
-    for theme_name in sorted(THEME_KEYWORDS.keys()):
-        keywords = THEME_KEYWORDS[theme_name]
-        
-        # Use whole-word matching to avoid substring false positives
-        keyword_count = sum(
-            1 for keyword in keywords 
-            if _match_keyword_whole_word(keyword, content_lower)
+    # Most entries touch few or no themes; skip tallying when nothing matched
+    if not matched_keywords:
+        return ThemeDetection.model_construct(
+            themes=[],
+            confidence="low"
         )
-        
-        if keyword_count > 0:
+    
+    # Count distinct matched keywords per theme via the reverse index,
+    # tracking the maximum count as we go (drives confidence below)
+    theme_keyword_counts = {}
+    max_keyword_count = 0
+    for keyword in matched_keywords:
+        for theme_name in _KEYWORD_THEMES[keyword]:
+            keyword_count = theme_keyword_counts.get(theme_name, 0) + 1
             theme_keyword_counts[theme_name] = keyword_count
+            if keyword_count > max_keyword_count:
+                max_keyword_count = keyword_count
     
     # Extract detected themes in deterministic alphabetical order
-    detected_themes = sorted(theme_keyword_counts.keys())
+    detected_themes = [
+        theme_name for theme_name in _SORTED_THEME_NAMES
+        if theme_name in theme_keyword_counts
+    ]
     
     # Calculate confidence based on maximum keyword count across all themes
-    max_keyword_count = max(theme_keyword_counts.values()) if theme_keyword_counts else 0
-    
     if max_keyword_count >= 3:
         confidence = "high"
     elif max_keyword_count >= 2:
@@ -371,7 +472,7 @@ def detect_themes(content: str) -> ThemeDetection:
     else:
         confidence = "low"
     
-    return ThemeDetection(
+    return ThemeDetection.model_construct(
         themes=detected_themes,
         confidence=confidence
     )
@@ -423,31 +524,49 @@ def detect_emotional_mode(
         )
         # Returns: "anxious" (pressure + rumination detected)
     """
-    content_lower = content.lower()
+    return _detect_emotional_mode(
+        content.lower(),
+        sentiment.polarity,
+        sentiment.subjectivity,
+        themes,
+        has_emotional_burden
+    )
+
+
+def _detect_emotional_mode(
+    content_lower: str,
+    polarity: float,
+    subjectivity: float,
+    themes: ThemeDetection,
+    has_emotional_burden: bool
+) -> str:
+    """
+    Emotional mode detection core for text that is already lowercased.
+    
+    See detect_emotional_mode() for the detection rules and precedence.
     
+    Args:
+        content_lower: Journal entry text, already lowercased
+        polarity: Sentiment polarity
+        subjectivity: Sentiment subjectivity
+        themes: Theme detection results
+        has_emotional_burden: Whether emotional burden was detected
+    
+    Returns:
+        str: One of "low_energy", "anxious", or "calm"
+    """
+    # Substring matching throughout: several keywords are multi-word phrases
     # Check for rumination keywords (cognitive looping, overthinking)
-    has_rumination = any(
-        keyword in content_lower  # Use substring matching for multi-word phrases
-        for keyword in RUMINATION_KEYWORDS
-    )
+    has_rumination = _RUMINATION_PATTERN.search(content_lower) is not None
     
     # Check for explicit anxiety keywords (direct worry/stress language)
-    has_explicit_anxiety = any(
-        keyword in content_lower  # Use substring matching for multi-word phrases
-        for keyword in EXPLICIT_ANXIETY_KEYWORDS
-    )
+    has_explicit_anxiety = _EXPLICIT_ANXIETY_PATTERN.search(content_lower) is not None
     
     # Check for pressure keywords (feeling behind, overwhelmed by demands)
-    has_pressure = any(
-        keyword in content_lower  # Use substring matching for multi-word phrases
-        for keyword in PRESSURE_KEYWORDS
-    )
+    has_pressure = _PRESSURE_PATTERN.search(content_lower) is not None
     
-    # Check for low-energy keywords
-    has_low_energy_keywords = any(
-        _match_keyword_whole_word(keyword, content_lower)
-        for keyword in LOW_ENERGY_KEYWORDS
-    )
+    # Check for low-energy keywords (whole-word matching)
+    has_low_energy_keywords = _LOW_ENERGY_PATTERN.search(content_lower) is not None
     
     # ANXIOUS mode: Highest priority for anxiety signals
     # Rationale: Rumination, explicit anxiety, and burden indicate anxiety even with neutral sentiment
@@ -477,11 +596,11 @@ def detect_emotional_mode(
     # LOW_ENERGY should NOT override ANXIOUS (anxiety takes precedence)
     if has_low_energy_keywords:
         # Strong signal: low-energy keywords present
-        if sentiment.polarity <= 0.3 and sentiment.subjectivity < 0.5:
+        if polarity <= 0.3 and subjectivity < 0.5:
             return "low_energy"
         # Weaker signal: keywords present but some energy/emotion detected
         # Still treat as low_energy if polarity is neutral-ish
-        if -0.1 <= sentiment.polarity <= 0.2:
+        if -0.1 <= polarity <= 0.2:
             return "low_energy"
     
     # CALM mode: Default fallback
@@ -489,6 +608,7 @@ def detect_emotional_mode(
     return "calm"
 
 
+@lru_cache(maxsize=ANALYSIS_CACHE_SIZE)
 def analyze_entry(content: str) -> Tuple[SentimentAnalysis, ThemeDetection, str]:
     """
     Perform complete NLP analysis on a journal entry.
@@ -504,6 +624,12 @@ def analyze_entry(content: str) -> Tuple[SentimentAnalysis, ThemeDetection, str]
     - Three modes: "low_energy", "anxious", "calm"
     - Non-breaking addition: existing code can ignore the mode if not needed
     
+    Memoization:
+    - Results are cached per exact content string (LRU, ANALYSIS_CACHE_SIZE entries)
+    - Cached models are shared between callers and are frozen (read-only)
+    - analyze_entry.cache_info() reports hits/misses for monitoring
+    - Cached entry text is dropped by clear_caches()
+    
     Defensive handling:
     - Empty or whitespace-only content returns neutral sentiment, no themes, calm mode
     - All analyses handle edge cases independently
@@ -521,24 +647,65 @@ def analyze_entry(content: str) -> Tuple[SentimentAnalysis, ThemeDetection, str]
         print(f"Themes: {themes.themes}")
         print(f"Mode: {mode}")  # "calm"
     """
-    sentiment = analyze_sentiment(content)
-    themes = detect_themes(content)
+    # Lowercase once; every keyword check below works on the same copy
+    content_lower = content.lower()
     
-    # Detect emotional burden (used for both sentiment override and mode detection)
-    has_emotional_burden = _detect_emotional_burden(content)
+    # Detect emotional burden once (used for both sentiment override and mode detection)
+    has_emotional_burden = _detect_emotional_burden(content_lower)
+    
+    polarity, subjectivity, label = _score_sentiment(content, content_lower, has_emotional_burden)
+    themes = _detect_themes(content_lower)
     
     # Detect emotional mode for adaptive response generation
-    mode = detect_emotional_mode(content, sentiment, themes, has_emotional_burden)
+    mode = _detect_emotional_mode(content_lower, polarity, subjectivity, themes, has_emotional_burden)
     
     # FIX 1: Sentiment correction for LOW_ENERGY contexts
     # Rationale: Flat, numb, or low-energy entries are sometimes labeled as "positive" by TextBlob,
     # which is emotionally inaccurate. Override positive sentiment to neutral for LOW_ENERGY mode.
-    if mode == "low_energy" and sentiment.polarity > 0:
-        # Create corrected sentiment with neutral polarity and label
-        sentiment = SentimentAnalysis(
-            polarity=-0.1,  # Slightly negative to ensure "neutral" label
-            subjectivity=sentiment.subjectivity,  # Preserve subjectivity
-            label="neutral"  # Override to neutral
-        )
+    if mode == "low_energy" and polarity > 0:
+        polarity = -0.1  # Slightly negative to ensure "neutral" label
+        label = "neutral"  # Override to neutral (subjectivity preserved)
+    
+    # Built once, after every override has been applied
+    sentiment = SentimentAnalysis.model_construct(
+        polarity=polarity,
+        subjectivity=subjectivity,
+        label=label
+    )
     
     return sentiment, themes, mode
+
+
+def clear_caches() -> None:
+    """
+    Drop all memoized analysis results, including the entry texts they are keyed by.
+    
+    Call alongside InMemoryStore.clear_all() so that clearing the store
+    leaves no journal content behind in this module's cache.
+    
+    Example:
+        store.clear_all()
+        clear_caches()
+    """
+    analyze_entry.cache_clear()
+
+
+def warmup() -> None:
+    """
+    Load the lazily initialized NLP resources ahead of the first request.
+    
+    TextBlob is imported, and its pattern lexicon (en-sentiment.xml) parsed,
+    on the first sentiment call, which would otherwise land on the first
+    user's request. Called once from the application startup hook. The warm-up text is
+    scored directly so it never occupies a slot in the analyze_entry cache.
+    
+    Failures are swallowed: a missing corpus should surface on the request
+    that actually needs it, not prevent the server from starting.
+    
+    Example:
+        warmup()  # at startup; first analyze_entry() call is now steady-state
+    """
+    try:
+        _get_pattern_sentiment()("warmup")
+    except Exception:
+        pass
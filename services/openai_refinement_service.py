@@ -1,14 +1,17 @@
-from openai import OpenAI
+import json
+import re
+from openai import AsyncOpenAI
 from typing import Optional
 import logging
 
 from models.schemas import SentimentAnalysis, ThemeDetection, EmpathyReflection
 from config.settings import (
-    OPENAI_API_KEY,
-    USE_OPENAI_REFINEMENT,
+    get_openai_settings,
     OPENAI_MODEL,
     OPENAI_MAX_TOKENS,
-    OPENAI_TEMPERATURE
+    OPENAI_TEMPERATURE,
+    OPENAI_MAX_RETRIES,
+    SKIP_REFINEMENT_FOR_TRIVIAL
 )
 
 
@@ -16,6 +19,14 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Shared async OpenAI client, created on first refinement (see _get_client)
+# Rationale: the client owns an httpx connection pool; reusing it keeps
+# connections to the API alive between requests instead of paying a new
+# TCP + TLS handshake for every journal entry. The async client lets the
+# event loop serve other requests while a refinement is in flight.
+_client: Optional[AsyncOpenAI] = None
+
+
 REFINEMENT_SYSTEM_PROMPT = """You are enhancing empathetic journal reflections to improve emotional resonance and user engagement.
 
 YOUR ROLE:
@@ -45,6 +56,50 @@ TONE:
 
 Your role is empathy expansion, not therapeutic intervention."""
 
+# System message shared by every refinement call
+# Built once; it is always the first message, so every request starts with
+# the same prefix (what OpenAI's automatic prompt caching keys on)
+_SYSTEM_MESSAGE = {"role": "system", "content": REFINEMENT_SYSTEM_PROMPT}
+
+
+# Prohibited advice keywords for refined reflections
+# Rationale: the LLM must not give advice or directive language
+ADVICE_KEYWORDS = [
+    "should", "must", "need to", "have to", "ought to",
+    "recommend", "suggest", "advise", "try to"
+]
+
+# Prohibited clinical terminology for refined reflections
+# Rationale: Prevent medicalization of the user's experience
+CLINICAL_TERMS = [
+    "diagnosis", "disorder", "syndrome", "therapy", "treatment",
+    "symptoms", "psychiatric", "clinical", "pathology", "patient"
+]
+
+# Whole-word alternations over each list, compiled once at import
+# Rationale: one scan of the refined text per list instead of a fresh
+# re.search per keyword; word boundaries avoid false positives
+# (e.g., "shoulder" contains "should", "conditional" contains "condition")
+_ADVICE_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(keyword) for keyword in ADVICE_KEYWORDS) + r')\b'
+)
+_CLINICAL_PATTERN = re.compile(
+    r'\b(?:' + '|'.join(re.escape(term) for term in CLINICAL_TERMS) + r')\b'
+)
+
+
+# Canonical two-line reply: "Message: <text>" then "Prompt: <question or none>"
+# Rationale: the model almost always answers in exactly the format the prompt
+# asks for; one match handles that case, and anything else (multi-line
+# messages, unlabeled replies) goes through the line-based parser.
+_CANONICAL_RESPONSE_PATTERN = re.compile(
+    r'\Amessage:[ \t]*(?P<message>\S[^\n]*)\n\s*prompt:[ \t]*(?P<prompt>[^\n]*)\Z',
+    re.IGNORECASE
+)
+
+# Prompt values the model uses to mean "no prompt"
+_EMPTY_PROMPT_VALUES = ("none", "null", "n/a")
+
 
 def _is_openai_available() -> bool:
     """
@@ -53,7 +108,59 @@ def _is_openai_available() -> bool:
     Returns:
         bool: True if API key exists and refinement is enabled
     """
-    return bool(OPENAI_API_KEY) and USE_OPENAI_REFINEMENT
+    settings = get_openai_settings()
+    return bool(settings.api_key) and settings.use_refinement
+
+
+def _get_client() -> AsyncOpenAI:
+    """
+    Return the shared OpenAI client, creating it on first use.
+    
+    Created lazily so the client is only built when refinement is enabled
+    and configured. Settings are cached for the life of the process, so the
+    API key cannot change underneath the shared client.
+    
+    Returns:
+        AsyncOpenAI: Client reused across all refinement calls
+    """
+    global _client
+    
+    if _client is None:
+        # The client retries transient failures itself (see OPENAI_MAX_RETRIES)
+        _client = AsyncOpenAI(
+            api_key=get_openai_settings().api_key,
+            max_retries=OPENAI_MAX_RETRIES
+        )
+    
+    return _client
+
+
+def _is_trivial_reflection(
+    base_reflection: EmpathyReflection,
+    sentiment: SentimentAnalysis,
+    themes: ThemeDetection
+) -> bool:
+    """
+    Check whether the template reflection is good enough to send as-is.
+    
+    Short acknowledgments of clearly positive entries with at most one theme
+    are where refinement adds least; they skip the API call entirely
+    (see SKIP_REFINEMENT_FOR_TRIVIAL).
+    
+    Args:
+        base_reflection: Original template-based reflection
+        sentiment: Sentiment analysis results
+        themes: Theme detection results
+    
+    Returns:
+        bool: True if refinement should be skipped
+    """
+    return (
+        sentiment.label == "positive"
+        and sentiment.polarity > 0.4
+        and len(themes.themes) <= 1
+        and len(base_reflection.message) < 120
+    )
 
 
 def _build_refinement_prompt(
@@ -64,8 +171,10 @@ def _build_refinement_prompt(
     """
     Build the user prompt for OpenAI refinement.
     
-    Provides context about the analysis results so the LLM can maintain
-    consistency with the detected sentiment and themes.
+    Provides the detected sentiment and themes so the LLM stays consistent
+    with the analysis. Kept to those per-entry facts and the base reflection:
+    every call pays for these input tokens, and the system prompt already
+    tells the model to preserve the original meaning.
     
     Args:
         base_reflection: Original template-based reflection
@@ -86,10 +195,8 @@ def _build_refinement_prompt(
     
     prompt = f"""Enhance the following empathetic reflection for emotional resonance and user engagement.
 
-Context (use for consistency, DO NOT change the analysis):
-- Sentiment: {sentiment_context}
-- Themes detected: {themes_str}
-- Subjectivity: {sentiment.subjectivity:.2f} (0=objective, 1=subjective)
+Sentiment: {sentiment_context}
+Themes detected: {themes_str}
 
 Base reflection:
 Message: {base_reflection.message}"""
@@ -97,14 +204,10 @@ Message: {base_reflection.message}"""
     if base_reflection.prompt:
         prompt += f"\nPrompt: {base_reflection.prompt}"
     
-    prompt += """\n\nExpand this into a warmer, more emotionally resonant reflection (3-6 sentences).
-- Acknowledge any complexity, mixed feelings, or effort present
-- Make it feel conversational and human
-- End with ONE optional open-ended question if appropriate
-
-Provide ONLY the enhanced reflection in this format:
-Message: [3-6 sentences, warm and emotionally resonant]
-Prompt: [one open-ended question or 'none']"""
+    # Style and structure rules live in REFINEMENT_SYSTEM_PROMPT; they are not
+    # repeated here so each call sends fewer input tokens
+    prompt += """\n\nProvide ONLY the enhanced reflection as a JSON object in this format:
+{"message": "[3-6 sentences, warm and emotionally resonant]", "prompt": "[one open-ended question]" or null}"""
     
     return prompt
 
@@ -113,8 +216,45 @@ def _parse_llm_response(response_text: str) -> tuple[Optional[str], Optional[str
     """
     Parse the LLM response to extract message and prompt.
     
+    The API is called in JSON mode, so the reply is normally a JSON object
+    with "message" and "prompt" keys and is decoded with a single json.loads().
+    Replies that are not a JSON object fall back to the label-based parser,
+    so a usable response is not discarded over formatting.
+    
+    Non-string values are treated as missing; a missing message then fails
+    validation and the base reflection is used.
+    
+    Args:
+        response_text: Raw text from OpenAI
+    
+    Returns:
+        tuple: (message, prompt) where prompt may be None
+    """
+    try:
+        data = json.loads(response_text)
+    except ValueError:
+        return _parse_labeled_response(response_text)
+    
+    if not isinstance(data, dict):
+        return _parse_labeled_response(response_text)
+    
+    message = data.get("message")
+    message = message.strip() if isinstance(message, str) else None
+    
+    prompt = data.get("prompt")
+    prompt = prompt.strip() if isinstance(prompt, str) else None
+    if not prompt or prompt.lower() in _EMPTY_PROMPT_VALUES:
+        prompt = None
+    
+    return message, prompt
+
+
+def _parse_labeled_response(response_text: str) -> tuple[Optional[str], Optional[str]]:
+    """
+    Parse a "Message: ... / Prompt: ..." style reply (non-JSON fallback).
+    
     Robust parsing that handles various response formats:
-    - Strict format: "Message: ..." and "Prompt: ..."
+    - Strict format: "Message: ..." and "Prompt: ..." (single regex match)
     - Relaxed format: If labels missing, treat entire response as message
     - Multi-line: Handles messages spanning multiple lines
     
@@ -129,6 +269,14 @@ def _parse_llm_response(response_text: str) -> tuple[Optional[str], Optional[str
     """
     response_text = response_text.strip()
     
+    # Fast path: exactly one message line followed by one prompt line
+    canonical_match = _CANONICAL_RESPONSE_PATTERN.match(response_text)
+    if canonical_match:
+        prompt = canonical_match.group("prompt").strip()
+        if not prompt or prompt.lower() in _EMPTY_PROMPT_VALUES:
+            prompt = None
+        return canonical_match.group("message").strip(), prompt
+    
     # Try to parse with labels first
     lines = response_text.split("\n")
     message_parts = []
@@ -154,13 +302,13 @@ def _parse_llm_response(response_text: str) -> tuple[Optional[str], Optional[str
             in_prompt = True
             # Extract content after "Prompt:"
             prompt_text = line_stripped.split(":", 1)[1].strip()
-            if prompt_text and prompt_text.lower() not in ["none", "null", "n/a"]:
+            if prompt_text and prompt_text.lower() not in _EMPTY_PROMPT_VALUES:
                 prompt = prompt_text
         # Continue accumulating message or prompt content
         elif in_message and line_stripped:
             message_parts.append(line_stripped)
         elif in_prompt and line_stripped and prompt is None:
-            if line_stripped.lower() not in ["none", "null", "n/a"]:
+            if line_stripped.lower() not in _EMPTY_PROMPT_VALUES:
                 prompt = line_stripped
     
     # If we found labeled content, use it
@@ -169,23 +317,20 @@ def _parse_llm_response(response_text: str) -> tuple[Optional[str], Optional[str
     else:
         # Fallback: If no "Message:" label found, treat entire response as message
         # This handles cases where the model responds naturally without labels
-        # Split on common question markers to extract potential prompt
-        question_markers = ["?", "What ", "How ", "Why ", "When ", "Where "]
-        
-        # Look for a question at the end
-        sentences = response_text.split(". ")
-        if sentences:
-            last_sentence = sentences[-1].strip()
-            # If last sentence is a question, treat it as prompt
-            if "?" in last_sentence:
-                prompt = last_sentence
-                # Everything else is the message
-                message = ". ".join(sentences[:-1])
-                if message:
-                    message = message.strip() + "."
-            else:
-                # No question found, entire response is message
-                message = response_text
+        # Look for a question at the end: rpartition isolates the last
+        # ". "-separated sentence in one scan, without building a list
+        head, _, last_sentence = response_text.rpartition(". ")
+        last_sentence = last_sentence.strip()
+        # If last sentence is a question, treat it as prompt
+        if "?" in last_sentence:
+            prompt = last_sentence
+            # Everything else is the message
+            message = head
+            if message:
+                message = message.strip() + "."
+        else:
+            # No question found, entire response is message
+            message = response_text
     
     return message, prompt
 
@@ -233,45 +378,29 @@ def _validate_refined_reflection(
         logger.warning(f"Refined message too long: {refined_length} chars")
         return False
     
+    combined_text = (refined_message + " " + (refined_prompt or "")).lower()
+    
     # Check for prohibited advice keywords using whole-word matching
     # Rationale: Avoid false positives (e.g., "shoulder" contains "should")
     # We use word boundaries to ensure we're catching actual directive language
-    advice_keywords = [
-        "should", "must", "need to", "have to", "ought to",
-        "recommend", "suggest", "advise", "try to"
-    ]
-    
-    combined_text = (refined_message + " " + (refined_prompt or "")).lower()
-    
-    # Use whole-word matching to avoid false positives
-    import re
-    for keyword in advice_keywords:
-        # Create pattern with word boundaries
-        pattern = r'\b' + re.escape(keyword) + r'\b'
-        if re.search(pattern, combined_text):
-            logger.warning(f"Refined reflection contains advice keyword: {keyword}")
-            return False
+    advice_match = _ADVICE_PATTERN.search(combined_text)
+    if advice_match:
+        logger.warning(f"Refined reflection contains advice keyword: {advice_match.group(0)}")
+        return False
     
     # Check for clinical terminology using whole-word matching
     # Rationale: Prevent medicalization while avoiding false positives
     # (e.g., "conditional" shouldn't trigger "condition")
-    clinical_terms = [
-        "diagnosis", "disorder", "syndrome", "therapy", "treatment",
-        "symptoms", "psychiatric", "clinical", "pathology", "patient"
-    ]
-    
-    # Use whole-word matching for clinical terms
-    for term in clinical_terms:
-        pattern = r'\b' + re.escape(term) + r'\b'
-        if re.search(pattern, combined_text):
-            logger.warning(f"Refined reflection contains clinical term: {term}")
-            return False
+    clinical_match = _CLINICAL_PATTERN.search(combined_text)
+    if clinical_match:
+        logger.warning(f"Refined reflection contains clinical term: {clinical_match.group(0)}")
+        return False
     
     # All validation checks passed
     return True
 
 
-def refine_reflection_with_llm(
+async def refine_reflection_with_llm(
     base_reflection: EmpathyReflection,
     sentiment: SentimentAnalysis,
     themes: ThemeDetection
@@ -290,9 +419,11 @@ def refine_reflection_with_llm(
     - No clinical or mental health terminology
     - Responses are 3-6 sentences for warmth and engagement
     - Falls back silently to base_reflection on any failure
+    - Async: the API round-trip does not block the server's event loop
     
     Defensive behavior:
     - Returns base_reflection if OpenAI is disabled or not configured
+    - Returns base_reflection for short, clearly positive entries (no API call)
     - Returns base_reflection if API call fails (network, rate limit, etc.)
     - Returns base_reflection if refined content fails validation
     - Never raises exceptions to API layer
@@ -311,7 +442,7 @@ def refine_reflection_with_llm(
             message="It sounds like you're experiencing some positive moments.",
             prompt="What else comes to mind?"
         )
-        refined = refine_reflection_with_llm(base, sentiment, themes)
+        refined = await refine_reflection_with_llm(base, sentiment, themes)
         # Returns refined version or base if refinement fails/disabled
     """
     # Check if OpenAI refinement is enabled and configured
@@ -319,26 +450,48 @@ def refine_reflection_with_llm(
         logger.info("OpenAI refinement disabled or not configured, using base reflection")
         return base_reflection
     
+    # Clearly positive, short reflections are sent as-is (no API call)
+    if SKIP_REFINEMENT_FOR_TRIVIAL and _is_trivial_reflection(base_reflection, sentiment, themes):
+        logger.info("Base reflection sufficient for this entry, skipping refinement")
+        return base_reflection
+    
     try:
-        # Initialize OpenAI client
-        client = OpenAI(api_key=OPENAI_API_KEY)
+        # Reuse the shared OpenAI client (keeps connections alive)
+        client = _get_client()
         
         # Build refinement prompt with context
         user_prompt = _build_refinement_prompt(base_reflection, sentiment, themes)
         
         # Call OpenAI API
         logger.info(f"Calling OpenAI API with model: {OPENAI_MODEL}")
-        response = client.chat.completions.create(
+        response = await client.chat.completions.create(
             model=OPENAI_MODEL,
             messages=[
-                {"role": "system", "content": REFINEMENT_SYSTEM_PROMPT},
+                _SYSTEM_MESSAGE,
                 {"role": "user", "content": user_prompt}
             ],
             max_tokens=OPENAI_MAX_TOKENS,
             temperature=OPENAI_TEMPERATURE,
+            response_format={"type": "json_object"},  # reply is one JSON object
             timeout=10.0  # 10 second timeout for responsiveness
         )
         
+        # Log token consumption for cost tracking (non-streaming responses
+        # always carry usage, so this needs no extra API call)
+        usage = response.usage
+        if usage is not None:
+            logger.info(
+                f"OpenAI usage: prompt_tokens={usage.prompt_tokens} "
+                f"completion_tokens={usage.completion_tokens} "
+                f"total_tokens={usage.total_tokens}"
+            )
+        
+        # A reply cut off at max_tokens is incomplete (and, in JSON mode,
+        # unparseable); never show a partial reflection
+        if response.choices[0].finish_reason == "length":
+            logger.warning("OpenAI response truncated at max_tokens")
+            return base_reflection
+        
         # Extract response text
         response_text = response.choices[0].message.content
         
@@ -355,9 +508,10 @@ def refine_reflection_with_llm(
             return base_reflection
         
         # Create refined reflection
+        # Strip here: EmpathyReflection does not normalize whitespace itself
         refined_reflection = EmpathyReflection(
-            message=refined_message,
-            prompt=refined_prompt
+            message=refined_message.strip(),
+            prompt=refined_prompt.strip() if refined_prompt else None
         )
         
         logger.info("Successfully refined reflection with OpenAI")
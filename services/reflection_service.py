@@ -1,8 +1,12 @@
-import random
-from typing import Optional
+from functools import lru_cache
+from typing import List, Optional
 from models.schemas import SentimentAnalysis, ThemeDetection, EmpathyReflection
 
 
+# Reflections are assembled from the fixed templates below, so they are built
+# with model_construct() rather than re-validated on every request.
+
+
 # Empathetic acknowledgment templates organized by sentiment label
 # Rewritten to be warmer, more emotionally validating, and human
 # Focus on acknowledging the effort of journaling and reflecting complexity
@@ -41,6 +45,17 @@ THEME_ADDITIONS = {
     "loss": "sitting with something painful, and that's not easy"
 }
 
+# Maximum number of distinct reflection inputs whose result is memoized
+# (see _build_reflection); the same label, template indexes, theme and mode
+# always produce the same reflection, so repeats reuse the built model
+REFLECTION_CACHE_SIZE = 1024
+
+# Theme sentences appended to the acknowledgment, formatted once at import
+_THEME_SUFFIXES = {
+    theme: f" I notice you're {theme_context}."
+    for theme, theme_context in THEME_ADDITIONS.items()
+}
+
 # Open-ended reflective prompts that encourage further exploration
 # Rewritten to be more emotionally aware, gentle, and engaging
 # These are non-prescriptive and don't instruct the user what to do
@@ -103,6 +118,31 @@ MODE_ADAPTIVE_PROMPTS = {
 }
 
 
+# generate_reflection_simple() has exactly one result per sentiment label,
+# so each is built once here (first template; prompt for neutral/negative)
+_SIMPLE_REFLECTIONS = {
+    label: EmpathyReflection.model_construct(
+        message=acknowledgments[0],
+        prompt=REFLECTIVE_PROMPTS[0] if label in ["neutral", "negative"] else None
+    )
+    for label, acknowledgments in ACKNOWLEDGMENT_TEMPLATES.items()
+}
+
+
+def _select_prompt(prompts: List[str], subjectivity_index: int) -> str:
+    """
+    Pick a prompt deterministically from subjectivity (same input = same output).
+    
+    Args:
+        prompts: Candidate prompts
+        subjectivity_index: int(abs(subjectivity * 1000))
+    
+    Returns:
+        str: Selected prompt
+    """
+    return prompts[subjectivity_index % len(prompts)]
+
+
 def generate_reflection(
     sentiment: SentimentAnalysis,
     themes: ThemeDetection,
@@ -135,7 +175,10 @@ def generate_reflection(
     Deterministic behavior:
     - Uses sentiment label or mode to select acknowledgment category
     - Uses theme count to decide whether to add theme context
-    - Uses random.seed() based on sentiment polarity for reproducibility
+    - Indexes templates by sentiment polarity/subjectivity for reproducibility
+      (no global random state, so concurrent requests cannot interfere)
+    - Results are memoized on the inputs that affect them (LRU,
+      REFLECTION_CACHE_SIZE entries); the returned model is frozen and shared
     
     Args:
         sentiment: SentimentAnalysis from NLP service
@@ -152,31 +195,67 @@ def generate_reflection(
         )
         # Returns validating, non-judgmental reflection
     """
+    # Reduce the inputs to exactly what template selection depends on
+    # Convert polarity/subjectivity to integers: multiply by 1000 and take absolute value
+    polarity_index = int(abs(sentiment.polarity * 1000))
+    subjectivity_index = int(abs(sentiment.subjectivity * 1000))
+    primary_theme = themes.themes[0] if themes.themes else None
+    
+    return _build_reflection(
+        sentiment.label,
+        polarity_index,
+        subjectivity_index,
+        primary_theme,
+        themes.confidence,
+        mode
+    )
+
+
+@lru_cache(maxsize=REFLECTION_CACHE_SIZE)
+def _build_reflection(
+    label: str,
+    polarity_index: int,
+    subjectivity_index: int,
+    primary_theme: Optional[str],
+    confidence: str,
+    mode: Optional[str]
+) -> EmpathyReflection:
+    """
+    Assemble a reflection from template-selection inputs (memoized).
+    
+    See generate_reflection() for the selection rules. All arguments are
+    hashable scalars, so identical inputs return the cached model.
+    
+    Args:
+        label: Sentiment label
+        polarity_index: int(abs(polarity * 1000)), selects the acknowledgment
+        subjectivity_index: int(abs(subjectivity * 1000)), selects the prompt
+        primary_theme: First detected theme, or None
+        confidence: Theme detection confidence
+        mode: Optional emotional mode
+    
+    Returns:
+        EmpathyReflection: Pydantic model with message and optional prompt
+    """
     # Select acknowledgment template based on mode (if provided) or sentiment label
     # Mode-adaptive templates provide better emotional accuracy for specific states
     if mode and mode in MODE_ADAPTIVE_TEMPLATES:
         acknowledgment_options = MODE_ADAPTIVE_TEMPLATES[mode]
     else:
         # Fallback to sentiment-based templates
-        acknowledgment_options = ACKNOWLEDGMENT_TEMPLATES[sentiment.label]
+        acknowledgment_options = ACKNOWLEDGMENT_TEMPLATES[label]
     
-    # Use polarity as seed for deterministic selection (same input = same output)
-    # Convert polarity to integer seed: multiply by 1000 and take absolute value
-    seed_value = int(abs(sentiment.polarity * 1000))
-    random.seed(seed_value)
-    
-    base_acknowledgment = random.choice(acknowledgment_options)
+    # Use polarity as index for deterministic selection (same input = same output)
+    base_acknowledgment = acknowledgment_options[polarity_index % len(acknowledgment_options)]
     
     # Add theme-aware context if themes were detected with medium/high confidence
     message = base_acknowledgment
-    if themes.themes and themes.confidence in ["medium", "high"]:
-        # Select the first theme (themes are alphabetically ordered, so deterministic)
-        primary_theme = themes.themes[0]
-        
-        if primary_theme in THEME_ADDITIONS:
-            theme_context = THEME_ADDITIONS[primary_theme]
+    # The first theme is used (themes are alphabetically ordered, so deterministic)
+    if primary_theme is not None and confidence in ["medium", "high"]:
+        theme_suffix = _THEME_SUFFIXES.get(primary_theme)
+        if theme_suffix is not None:
             # Integrate theme context naturally into the message
-            message = f"{base_acknowledgment} I notice you're {theme_context}."
+            message = base_acknowledgment + theme_suffix
     
     # Generate optional reflective prompt
     # Mode-adaptive prompts lower cognitive load for low-energy/anxious states
@@ -188,21 +267,15 @@ def generate_reflection(
         # Always include prompt for low_energy and anxious modes (they need gentle guidance)
         # For calm mode, use same logic as before (neutral/negative/low confidence)
         if mode in ["low_energy", "anxious"]:
-            prompt_seed = int(abs(sentiment.subjectivity * 1000))
-            random.seed(prompt_seed)
-            prompt = random.choice(MODE_ADAPTIVE_PROMPTS[mode])
-        elif mode == "calm" and (sentiment.label in ["neutral", "negative"] or themes.confidence == "low"):
-            prompt_seed = int(abs(sentiment.subjectivity * 1000))
-            random.seed(prompt_seed)
-            prompt = random.choice(MODE_ADAPTIVE_PROMPTS[mode])
+            prompt = _select_prompt(MODE_ADAPTIVE_PROMPTS[mode], subjectivity_index)
+        elif mode == "calm" and (label in ["neutral", "negative"] or confidence == "low"):
+            prompt = _select_prompt(MODE_ADAPTIVE_PROMPTS[mode], subjectivity_index)
     else:
         # Fallback to original prompt logic
-        if sentiment.label in ["neutral", "negative"] or themes.confidence == "low":
-            prompt_seed = int(abs(sentiment.subjectivity * 1000))
-            random.seed(prompt_seed)
-            prompt = random.choice(REFLECTIVE_PROMPTS)
+        if label in ["neutral", "negative"] or confidence == "low":
+            prompt = _select_prompt(REFLECTIVE_PROMPTS, subjectivity_index)
     
-    return EmpathyReflection(
+    return EmpathyReflection.model_construct(
         message=message,
         prompt=prompt
     )
@@ -228,15 +301,6 @@ def generate_reflection_simple(sentiment_label: str) -> EmpathyReflection:
         reflection = generate_reflection_simple("positive")
         # Returns basic validating acknowledgment
     """
-    # Use first template from each category for simplicity
-    acknowledgment = ACKNOWLEDGMENT_TEMPLATES[sentiment_label][0]
-    
-    # Add prompt for neutral/negative sentiment
-    prompt: Optional[str] = None
-    if sentiment_label in ["neutral", "negative"]:
-        prompt = REFLECTIVE_PROMPTS[0]
-    
-    return EmpathyReflection(
-        message=acknowledgment,
-        prompt=prompt
-    )
+    # Precomputed per label: first template from each category for simplicity,
+    # plus a prompt for neutral/negative sentiment (see _SIMPLE_REFLECTIONS)
+    return _SIMPLE_REFLECTIONS[sentiment_label]
@@ -1,6 +1,23 @@
 import uuid
+from collections import deque
+from functools import lru_cache
 from typing import Dict, Optional, List
-from threading import Lock
+
+
+# Concurrency note: every store method performs single built-in dict/deque
+# operations (set, get, membership, clear, len, append, or one list()
+# snapshot). Each of these is atomic in CPython -- under the GIL, and via the
+# per-object lock in free-threaded builds -- so no extra Lock is taken.
+# store_entry/clear_all touch both the dict and the recent-entries deque; a
+# concurrent reader may briefly see one updated before the other, which is
+# harmless for the advisory count/recent views. Any future method that needs
+# several operations to stay strictly consistent must add its own locking.
+
+# Number of most recent entries kept for get_recent_entries()
+# Rationale: insights only look at the last few entries, so a bounded sidecar
+# avoids copying the whole store on every POST. Also a privacy cap: the only
+# listing view can never expose more than this many entries.
+RECENT_ENTRIES_MAX = 64
 
 
 class InMemoryStore:
@@ -14,12 +31,14 @@ class InMemoryStore:
     - No listing/browsing capabilities (retrieve by ID only)
     
     Thread safety:
-    - Uses threading.Lock to prevent race conditions
-    - Safe for concurrent access in FastAPI async context
+    - Reads and writes use atomic dict/deque operations (see module note)
+    - store_entry/clear_all update the dict and the recent-entries deque in
+      two steps; a concurrent reader may briefly see only one of them
+    - Safe for concurrent access in FastAPI async context and threadpool
     
     Attributes:
         _store: Internal dictionary mapping UUID strings to entry data
-        _lock: Threading lock for synchronizing access
+        _recent: Most recent entries, oldest first (at most RECENT_ENTRIES_MAX)
     
     Example:
         store = InMemoryStore()
@@ -29,13 +48,13 @@ class InMemoryStore:
     
     def __init__(self):
         """
-        Initialize the in-memory store with an empty dictionary and lock.
+        Initialize the in-memory store with an empty dictionary.
         
         The store is completely empty on initialization - no pre-seeded data,
         no configuration files, no external dependencies.
         """
         self._store: Dict[str, dict] = {}
-        self._lock: Lock = Lock()
+        self._recent: deque = deque(maxlen=RECENT_ENTRIES_MAX)
     
     def store_entry(self, entry_data: dict) -> str:
         """
@@ -48,8 +67,8 @@ class InMemoryStore:
         user identity, timestamp, or entry content.
         
         Args:
-            entry_data: Dictionary containing the complete entry data
-                       (typically a JournalEntryResponse.dict())
+            entry_data: Entry dict built by create_entry: the response
+                       fields (with entry_id left as "") plus "mode"
         
         Returns:
             str: Generated UUID for this entry
@@ -64,8 +83,8 @@ class InMemoryStore:
         """
         entry_id = str(uuid.uuid4())
         
-        with self._lock:
-            self._store[entry_id] = entry_data
+        self._store[entry_id] = entry_data
+        self._recent.append(entry_data)
         
         return entry_id
     
@@ -92,8 +111,7 @@ class InMemoryStore:
             else:
                 print("Entry not found")
         """
-        with self._lock:
-            return self._store.get(entry_id)
+        return self._store.get(entry_id)
     
     def entry_exists(self, entry_id: str) -> bool:
         """
@@ -111,8 +129,7 @@ class InMemoryStore:
             if store.entry_exists(entry_id):
                 entry = store.get_entry(entry_id)
         """
-        with self._lock:
-            return entry_id in self._store
+        return entry_id in self._store
     
     def clear_all(self) -> None:
         """
@@ -121,13 +138,15 @@ class InMemoryStore:
         WARNING: This is a destructive operation with no undo.
         Intended for testing or explicit user request to clear data.
         
-        Thread-safe operation that removes all stored entries.
+        Thread-safe operation that removes all stored entries. Only the store
+        is cleared: callers that need all entry text gone from process memory
+        should also call services.nlp_service.clear_caches().
         
         Example:
             store.clear_all()  # All entries are now gone
         """
-        with self._lock:
-            self._store.clear()
+        self._store.clear()
+        self._recent.clear()
     
     def get_entry_count(self) -> int:
         """
@@ -143,8 +162,7 @@ class InMemoryStore:
             count = store.get_entry_count()
             print(f"Currently storing {count} entries")
         """
-        with self._lock:
-            return len(self._store)
+        return len(self._store)
     
     def get_recent_entries(self, limit: int = 4) -> list:
         """
@@ -158,6 +176,9 @@ class InMemoryStore:
         
         Thread-safe operation.
         
+        Only the last RECENT_ENTRIES_MAX entries are tracked, so limit is
+        effectively capped at that value.
+        
         Args:
             limit: Maximum number of recent entries to return (default: 4)
         
@@ -168,18 +189,16 @@ class InMemoryStore:
             recent = store.get_recent_entries(limit=3)
             # Returns last 3 entries for pattern analysis
         """
-        with self._lock:
-            # Get all entries and return the last N
-            # Note: This assumes insertion order is preserved (Python 3.7+)
-            all_entries = list(self._store.values())
-            return all_entries[-limit:] if len(all_entries) >= limit else all_entries
+        # Snapshot the bounded recent-entries deque in one atomic list() call
+        # (O(RECENT_ENTRIES_MAX), independent of store size), then return the last N
+        recent_entries = list(self._recent)
+        return recent_entries[-limit:] if len(recent_entries) >= limit else recent_entries
 
 
 # Global singleton instance for use across the application
-# This ensures all parts of the app share the same in-memory store
-_store_instance: Optional[InMemoryStore] = None
-
-
+# This ensures all parts of the app share the same in-memory store; the
+# single-slot lru_cache holds it, so each call is one C-level cache probe
+@lru_cache(maxsize=1)
 def get_store() -> InMemoryStore:
     """
     Get the global singleton instance of the in-memory store.
@@ -187,8 +206,10 @@ def get_store() -> InMemoryStore:
     This function ensures only one store instance exists throughout
     the application lifecycle, preventing data fragmentation.
     
-    Thread-safe: First call creates the instance, subsequent calls
-    return the same instance.
+    The first call creates the instance (memoized by lru_cache) and later
+    calls return it. lru_cache does not serialize that first call, so it
+    should happen before any worker threads start; main.py resolves the
+    store at import for this reason.
     
     Returns:
         InMemoryStore: The global store instance
@@ -199,9 +220,4 @@ def get_store() -> InMemoryStore:
         store = get_store()
         entry_id = store.store_entry(data)
     """
-    global _store_instance
-    
-    if _store_instance is None:
-        _store_instance = InMemoryStore()
-    
-    return _store_instance
+    return InMemoryStore()